@@ -1,23 +1,534 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import concurrent.futures
+import contextlib
+import functools
 import os
 
-import shutil
 from pathlib import Path
+from typing import Tuple, Union
 
-from apppath.utilities import SYSTEM, ensure_existence, get_win_folder
+from apppath.utilities import (
+    SYSTEM,
+    background_rmtree,
+    ensure_existence,
+    fast_rmtree,
+    get_win_folder,
+    sanitise_path,
+)
 
 __author__ = "Christian Heider Nielsen"
 __doc__ = "Application data directories extension for pathlib"
 
-__all__ = ["AppPath"]
+__all__ = ["AppPath", "reset_env_cache"]
 
+# pathlib.Path.home() re-reads $HOME (or pwd) and os.getenv re-queries the environment on every call, but
+# both are stable for the lifetime of a process, so the builders below go through lazy memos instead.
+# reset_env_cache() drops the memos, e.g. for tests that monkeypatch the environment.
 
-class AppPath(object):
+_HOME = None
+_XDG_CACHE = {}
+
+
+# Space replacement as a prebuilt translation table; case folding stays with str.lower(), which covers
+# the full Unicode range where an ASCII-only table would silently relocate non-ASCII app names.
+_NORM_TABLE = str.maketrans({" ": "_"})
+
+
+def _normalise(s: str) -> str:
+    """Normalise an app name/author/version into a path component"""
+    return s.strip().lower().translate(_NORM_TABLE)
+
+
+def _home() -> Path:
+    """Memoised pathlib.Path.home()"""
+    global _HOME
+    if _HOME is None:
+        _HOME = Path.home()
+    return _HOME
+
+
+# Spec-default factories per XDG variable, hoisted to module scope so the builders neither allocate a
+# fresh lambda per call nor materialise the fallback Path when the variable is set.
+_XDG_DEFAULTS = {
+    "XDG_DATA_HOME": lambda: _home() / ".local" / "share",
+    "XDG_CONFIG_HOME": lambda: _home() / ".config",
+    "XDG_CACHE_HOME": lambda: _home() / ".cache",
+    "XDG_STATE_HOME": lambda: _home() / ".local" / "state",
+}
+
+
+def _xdg(name: str) -> Path:
+    """Memoised XDG base-dir env lookup, falling back to the spec default when the variable is unset"""
+    path = _XDG_CACHE.get(name)
+    if path is None:
+        value = os.environ.get(name)
+        path = Path(value) if value else _XDG_DEFAULTS[name]()
+        _XDG_CACHE[name] = path
+    return path
+
+
+def reset_env_cache() -> None:
+    """
+    Forget the memoised $HOME and XDG base-dir lookups, so the next path access re-reads the environment
+
+    :return:
+    :rtype:"""
+    global _HOME
+    _HOME = None
+    _XDG_CACHE.clear()
+    _darwin_library_base.cache_clear()
+    _expanded.cache_clear()
+    for builder in _CACHED_BUILDERS:  # builder results embed the env derived bases
+        builder.cache_clear()
+
+
+# Platform specific path builders. SYSTEM never changes at runtime, so instead of re-branching on it inside
+# every builder on every call, each builder below exists in a "win32", "darwin" and "posix" variant and the
+# right one is bound once at import time, the same way os.path is aliased to posixpath/ntpath. The
+# cross-platform overview of the conventions lives in the AppPath.__init__ docstring.
+
+
+@functools.lru_cache(maxsize=None)
+def _win_appdata_base(roaming: bool = False) -> str:
+    """Normalised local/roaming appdata base, resolved once per process and shared by the user data,
+    config, state, cache and log builders"""
+    return os.path.normpath(get_win_folder("CSIDL_APPDATA" if roaming else "CSIDL_LOCAL_APPDATA"))
+
+
+@functools.lru_cache(maxsize=None)
+def _win_common_appdata_base() -> str:
+    """Normalised common (all users) appdata base, resolved once per process"""
+    return os.path.normpath(get_win_folder("CSIDL_COMMON_APPDATA"))
+
+
+@functools.lru_cache(maxsize=None)
+def _darwin_library_base(folder: str) -> str:
+    """~/Library/<folder> base, resolved once per process"""
+    return os.path.join(_home(), "Library", folder)
+
+
+@functools.lru_cache(maxsize=None)
+def _expanded(entry: str) -> str:
+    """Memoised os.path.expanduser for XDG dir-list entries (expanduser does a pwd lookup)"""
+    return os.path.expanduser(entry.rstrip(os.sep))
+
+
+def _user_data_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Windows user data dir, CSIDL_APPDATA if roaming else CSIDL_LOCAL_APPDATA"""
+    if app_author is None:
+        app_author = app_name
+    parts = [_win_appdata_base(roaming)]
+    if app_name:
+        if app_author is not False:
+            parts.append(app_author)
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_data_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Mac OS X user data dir, ~/Library/Application Support/<AppName>"""
+    parts = [_darwin_library_base("Application Support")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_data_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Unix user data dir, $XDG_DATA_HOME or ~/.local/share/<AppName> per the XDG spec"""
+    parts = [_xdg("XDG_DATA_HOME")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _site_data_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
+) -> Path:
+    """Windows shared data dir, CSIDL_COMMON_APPDATA. WARNING: hidden system directory on Vista"""
+    if app_author is None:
+        app_author = app_name
+    parts = [_win_common_appdata_base()]
+    if app_name:
+        if app_author is not False:
+            parts.append(app_author)
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _site_data_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
+) -> Path:
+    """Mac OS X shared data dir, /Library/Application Support/<AppName>"""
+    parts = [_darwin_library_base("Application Support")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _site_data_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
+) -> Union[Path, Tuple[Path, ...]]:
+    """Unix shared data dir, $XDG_DATA_DIRS[0] by default, a tuple of every dir if multi_path"""
+    dirs = os.getenv("XDG_DATA_DIRS", os.pathsep.join(["/usr/local/share", "/usr/share"]))
+    suffix = os.path.join(app_name, version) if app_name and version else app_name
+    if not multi_path:  # only the first entry is wanted, so do not expand the rest of the list
+        first = _expanded(dirs.split(os.pathsep, 1)[0])
+        return Path(os.path.join(first, suffix)) if suffix else Path(first)
+    join = os.path.join  # locals for the comprehension, skipping the module attribute walks per entry
+    if suffix:
+        return tuple(Path(join(_expanded(x), suffix)) for x in dirs.split(os.pathsep))
+    return tuple(Path(_expanded(x)) for x in dirs.split(os.pathsep))
+
+
+def _user_config_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Windows user config dir, same as user data dir"""
+    path = _user_data_path_win32(app_name, app_author, None, roaming)
+    if app_name and version:
+        path /= version
+    return path
+
+
+def _user_config_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Mac OS X user config dir, ~/Library/Preferences/<AppName>"""
+    parts = [_darwin_library_base("Preferences")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_config_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Unix user config dir, $XDG_CONFIG_HOME or ~/.config/<AppName> per the XDG spec"""
+    parts = [_xdg("XDG_CONFIG_HOME")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _site_config_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
+) -> Path:
+    """Windows site config dir, same as site data dir. WARNING: hidden system directory on Vista"""
+    path = _site_data_path_win32(app_name, app_author)
+    if app_name and version:
+        path /= version
+    return path
+
+
+def _site_config_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
+) -> Path:
+    """Mac OS X site config dir, ~/Library/Preferences/<AppName>"""
+    parts = [_darwin_library_base("Preferences")]
+    if app_name:
+        parts.append(app_name)
+    return Path(os.path.join(*parts))
+
+
+def _site_config_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
+) -> Union[Path, Tuple[Path, ...]]:
+    """Unix site config dir, $XDG_CONFIG_DIRS[0] or /etc/xdg/<AppName>, a tuple of every dir if
+    multi_path"""
+    dirs = os.getenv("XDG_CONFIG_DIRS", "/etc/xdg")
+    suffix = os.path.join(app_name, version) if app_name and version else app_name
+    if not multi_path:  # only the first entry is wanted, so do not expand the rest of the list
+        first = _expanded(dirs.split(os.pathsep, 1)[0])
+        return Path(os.path.join(first, suffix)) if suffix else Path(first)
+    join = os.path.join  # locals for the comprehension, skipping the module attribute walks per entry
+    if suffix:
+        return tuple(Path(join(_expanded(x), suffix)) for x in dirs.split(os.pathsep))
+    return tuple(Path(_expanded(x)) for x in dirs.split(os.pathsep))
+
+
+def _user_cache_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
+) -> Path:
+    """Windows user cache dir, CSIDL_LOCAL_APPDATA with "Cache" appended unless opinionated=False"""
+    if app_author is None:
+        app_author = app_name
+    parts = [_win_appdata_base()]
+    if app_name:
+        if app_author is not False:
+            parts.append(app_author)
+        parts.append(app_name)
+        if opinionated:
+            parts.append("Cache")
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_cache_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
+) -> Path:
+    """Mac OS X user cache dir, ~/Library/Caches/<AppName>"""
+    parts = [_darwin_library_base("Caches")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_cache_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
+) -> Path:
+    """Unix user cache dir, $XDG_CACHE_HOME or ~/.cache/<AppName> per the XDG spec"""
+    parts = [_xdg("XDG_CACHE_HOME")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_state_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Windows user state dir, same as user data dir"""
+    path = _user_data_path_win32(app_name, app_author, None, roaming)
+    if app_name and version:
+        path /= version
+    return path
+
+
+def _user_state_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Mac OS X user state dir, same as user data dir"""
+    path = _user_data_path_darwin(app_name, app_author, None, roaming)
+    if app_name and version:
+        path /= version
+    return path
+
+
+def _user_state_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
+) -> Path:
+    """Unix user state dir, $XDG_STATE_HOME or ~/.local/state/<AppName> per the Debian XDG extension"""
+    parts = [_xdg("XDG_STATE_HOME")]
+    if app_name:
+        parts.append(app_name)
+        if version:
+            parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_log_path_win32(
+    app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
+) -> Path:
+    """Windows user log dir, user data dir with "Logs" appended unless opinionated=False"""
+    parts = [_user_data_path_win32(app_name, app_author, version)]
+    if opinionated:
+        parts.append("Logs")
+    return Path(os.path.join(*parts))
+
+
+def _user_log_path_darwin(
+    app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
+) -> Path:
+    """Mac OS X user log dir, ~/Library/Logs/<AppName>"""
+    parts = [_darwin_library_base("Logs"), app_name]
+    if app_name and version:
+        parts.append(version)
+    return Path(os.path.join(*parts))
+
+
+def _user_log_path_posix(
+    app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
+) -> Path:
+    """Unix user log dir, user cache dir with "log" appended unless opinionated=False"""
+    parts = [_user_cache_path_posix(app_name, app_author, version)]
+    if opinionated:
+        parts.append("log")
+    return Path(os.path.join(*parts))
+
+
+_BUILDER_DISPATCH = {
+    "win32": (
+        _user_data_path_win32,
+        _site_data_path_win32,
+        _user_config_path_win32,
+        _site_config_path_win32,
+        _user_cache_path_win32,
+        _user_state_path_win32,
+        _user_log_path_win32,
+    ),
+    "darwin": (
+        _user_data_path_darwin,
+        _site_data_path_darwin,
+        _user_config_path_darwin,
+        _site_config_path_darwin,
+        _user_cache_path_darwin,
+        _user_state_path_darwin,
+        _user_log_path_darwin,
+    ),
+}
+
+(
+    _user_data_path,
+    _site_data_path,
+    _user_config_path,
+    _site_config_path,
+    _user_cache_path,
+    _user_state_path,
+    _user_log_path,
+) = _BUILDER_DISPATCH.get(
+    SYSTEM,
+    (
+        _user_data_path_posix,
+        _site_data_path_posix,
+        _user_config_path_posix,
+        _site_config_path_posix,
+        _user_cache_path_posix,
+        _user_state_path_posix,
+        _user_log_path_posix,
+    ),
+)
+
+# The selected builders are pure in their arguments (the environment reads behind them are memoised
+# above) and return immutable Paths, so their results are cached as well; a repeat construction for the
+# same app collapses into a dict hit. AppPath.clear_cache/reset_env_cache drop the memos.
+_user_data_path = functools.lru_cache(maxsize=64)(_user_data_path)
+_site_data_path = functools.lru_cache(maxsize=64)(_site_data_path)
+_user_config_path = functools.lru_cache(maxsize=64)(_user_config_path)
+_site_config_path = functools.lru_cache(maxsize=64)(_site_config_path)
+_user_cache_path = functools.lru_cache(maxsize=64)(_user_cache_path)
+_user_state_path = functools.lru_cache(maxsize=64)(_user_state_path)
+_user_log_path = functools.lru_cache(maxsize=64)(_user_log_path)
+
+_CACHED_BUILDERS = (
+    _user_data_path,
+    _site_data_path,
+    _user_config_path,
+    _site_config_path,
+    _user_cache_path,
+    _user_state_path,
+    _user_log_path,
+)
+
+
+def _ensuring(method: callable) -> callable:
+    """Wrap a Path method so a deferred ensure_existence runs before the filesystem is first touched"""
+
+    @functools.wraps(method)
+    def call(self, *args, **kwargs):
+        """"""
+        self._ensure()
+        return method(self, *args, **kwargs)
+
+    return call
+
+
+class _EnsuredPath(type(Path())):
+    """
+    Path whose ensure_existence call is deferred until the first filesystem-touching operation or until
+    a child/sibling path is derived from it, so that merely computing, printing or fspath-ing the path
+    performs no mkdir/stat syscalls"""
+
+    __slots__ = ("_ensure_pending", "_sanitise_func")
+
+    def _ensure(self) -> None:
+        """"""
+        if getattr(self, "_ensure_pending", False):
+            self._ensure_pending = False
+            ensure_existence(Path(self), sanitisation_func=getattr(self, "_sanitise_func", sanitise_path))
+
+    stat = _ensuring(Path.stat)
+    lstat = _ensuring(Path.lstat)
+    exists = _ensuring(Path.exists)
+    is_dir = _ensuring(Path.is_dir)
+    is_file = _ensuring(Path.is_file)
+    open = _ensuring(Path.open)
+    iterdir = _ensuring(Path.iterdir)
+    glob = _ensuring(Path.glob)
+    rglob = _ensuring(Path.rglob)
+    mkdir = _ensuring(Path.mkdir)
+    touch = _ensuring(Path.touch)
+    unlink = _ensuring(Path.unlink)
+    rmdir = _ensuring(Path.rmdir)
+    chmod = _ensuring(Path.chmod)
+    read_text = _ensuring(Path.read_text)
+    read_bytes = _ensuring(Path.read_bytes)
+    write_text = _ensuring(Path.write_text)
+    write_bytes = _ensuring(Path.write_bytes)
+
+    # Deriving a path counts as use: the joined result escapes as a plain Path without the pending flag
+    # and is typically opened or written straight away (e.g. (app.user_data / "cfg.json").write_text()),
+    # so the ensure fires at derivation time to keep the eager-ensure contract for children.
+    __truediv__ = _ensuring(Path.__truediv__)
+    __rtruediv__ = _ensuring(Path.__rtruediv__)
+    joinpath = _ensuring(Path.joinpath)
+    with_name = _ensuring(Path.with_name)
+    with_suffix = _ensuring(Path.with_suffix)
+
+
+class _CachedPathProperty:
+    """
+    functools.cached_property equivalent backed by the slotted _path_cache dict, since __slots__ on
+    AppPath removes the instance __dict__ that cached_property stores into"""
+
+    def __init__(self, func: callable):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        cache = instance._path_cache
+        try:
+            return cache[self.name]
+        except KeyError:
+            value = cache[self.name] = self.func(instance)
+            return value
+
+
+class AppPath:
     r"""
     AppPath class for easing cross platform access to proper app data directories
     This class is an abstraction for getting system conventional application paths for data, logs, etc."""
 
+    # No per-instance __dict__: attribute reads go straight through the slot descriptors and an instance
+    # shrinks to the eight references below.
+    __slots__ = (
+        "_app_name",
+        "_app_author",
+        "_app_version",
+        "_roaming",
+        "_multi_path",
+        "_ensure_existence",
+        "_sanitise_func",
+        "_path_cache",
+    )
+
     def __init__(
         self,
         app_name: str,
@@ -84,48 +595,49 @@ class AppPath(object):
         :param ensure_existence_on_access:
         :param normalise_path:"""
         assert isinstance(app_name, str)
+        if not isinstance(app_author, str):
+            assert app_author is None
+        if app_version is not None and type(app_version) is not str:  # str fast path, common case
+            app_version = str(app_version)
         if normalise_path:
-            app_name = app_name.strip().lower().replace(" ", "_")
+            app_name = _normalise(app_name)
+            if app_author is not None:
+                app_author = _normalise(app_author)
+            if app_version is not None:
+                app_version = _normalise(app_version)
         self._app_name = app_name
-        if isinstance(app_author, str):
-            if normalise_path:
-                app_author = app_author.strip().lower().replace(" ", "_")
-        else:
-            assert app_author is None
         self._app_author = app_author
-        if isinstance(app_version, (int, float)):
-            app_version = str(app_version)
-        if isinstance(app_version, str):
-            if normalise_path:
-                app_version = app_version.strip().lower().replace(" ", "_")
         self._app_version = app_version
         self._roaming = roaming
         self._multi_path = multi_path
         self._ensure_existence = ensure_existence_on_access
+        self._sanitise_func = sanitise_path if normalise_path else None  # resolved once, not per access
+        self._path_cache = {}
 
-    def __divmod__(self, other):
-        return self.__truediv__(other)
-
-    def __truediv__(self, other):
+    def _not_a_path(self, other):
+        """"""
         raise ArithmeticError(
             "The AppPath class itself is not a Path, you should use one of it path properties ("
             'e.g. ".user_data"  or ".user_config")'
         )
 
-    @property
+    # All the misuse guards raise directly instead of forwarding through an extra call frame
+    __truediv__ = __rtruediv__ = __divmod__ = _not_a_path
+
+    @_CachedPathProperty
     def user_data(self) -> Path:
         """
         User data path
 
         :return:
         :rtype:"""
-        path = self._user_data_path(
-            self._app_name, self._app_author, version=self._app_version, roaming=self._roaming,
+        return self._defer_ensurance(
+            self._user_data_path(
+                self._app_name, self._app_author, version=self._app_version, roaming=self._roaming,
+            )
         )
-        ensure_existence(path, enabled=self._ensure_existence)
-        return path
 
-    @property
+    @_CachedPathProperty
     def site_data(self) -> Path:
         """
         Site data path
@@ -135,23 +647,24 @@ class AppPath(object):
         path = self._site_data_path(
             self._app_name, self._app_author, version=self._app_version, multi_path=self._multi_path,
         )
-        ensure_existence(path, enabled=self._ensure_existence)
+        if isinstance(path, Path):
+            return self._defer_ensurance(path)
         return path
 
-    @property
+    @_CachedPathProperty
     def user_config(self) -> Path:
         """
         User config path
 
         :return:
         :rtype:"""
-        path = self._user_config_path(
-            self._app_name, self._app_author, version=self._app_version, roaming=self._roaming,
+        return self._defer_ensurance(
+            self._user_config_path(
+                self._app_name, self._app_author, version=self._app_version, roaming=self._roaming,
+            )
         )
-        ensure_existence(path, enabled=self._ensure_existence)
-        return path
 
-    @property
+    @_CachedPathProperty
     def site_config(self) -> Path:
         """
         Site config path
@@ -161,32 +674,33 @@ class AppPath(object):
         site_config = self._site_config_path(
             self._app_name, self._app_author, version=self._app_version, multi_path=self._multi_path,
         )
-        ensure_existence(site_config, enabled=self._ensure_existence)
+        if isinstance(site_config, Path):
+            return self._defer_ensurance(site_config)
         return site_config
 
-    @property
+    @_CachedPathProperty
     def user_cache(self) -> Path:
         """
         User cache path
 
         :return:
         :rtype:"""
-        path = self._user_cache_path(self._app_name, self._app_author, version=self._app_version)
-        ensure_existence(path, enabled=self._ensure_existence)
-        return path
+        return self._defer_ensurance(
+            self._user_cache_path(self._app_name, self._app_author, version=self._app_version)
+        )
 
-    @property
+    @_CachedPathProperty
     def user_state(self) -> Path:
         """
         User state path
 
         :return:
         :rtype:"""
-        path = self._user_state_path(self._app_name, self._app_author, version=self._app_version)
-        ensure_existence(path, enabled=self._ensure_existence)
-        return path
+        return self._defer_ensurance(
+            self._user_state_path(self._app_name, self._app_author, version=self._app_version)
+        )
 
-    @property
+    @_CachedPathProperty
     def user_log(self) -> Path:
         """
         User log path
@@ -194,441 +708,173 @@ class AppPath(object):
         :return:
         :rtype:"""
 
-        path = self._user_log_path(self._app_name, self._app_author, version=self._app_version)
-        ensure_existence(path, enabled=self._ensure_existence)
-        return path
-
-    @staticmethod
-    def _user_data_path(
-        app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
-    ) -> Path:
-        r"""Return full path to the user-specific data dir for this application.
-
-        "app_name" is the name of application.
-        If None, just the system directory is returned.
-        "app_author" (only used on Windows) is the name of the
-        app_author or distributing body for this application. Typically
-        it is the owning company name. This falls back to app_name. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when app_name is present.
-        "roaming" (boolean, default False) can be set True to use the Windows
-        roaming appdata directory. That means that for users on a Windows
-        network setup for roaming profiles, this user data will be
-        sync'd on login. See
-        <http://technet.microsoft.com/en-us/library/cc766489(WS.10).aspx>
-        for a discussion of issues.
-
-
-        Notes:
-        - MSDN on where to store app data files:
-        http://support.microsoft.com/default.aspx?scid=kb;en-us;310294#XSLTH3194121123120121120120
-        - Mac OS X: http://developer.apple.com/documentation/MacOSX/Conceptual/BPFileSystem/index.html
-        - XDG spec for Un*x: https://standards.freedesktop.org/basedir-spec/basedir-spec-latest.html
-
-        Typical user data directories are:
-        Mac OS X:               ~/Library/Application Support/<AppName>
-        Unix:                   ~/.local/share/<AppName>    # or in $XDG_DATA_HOME, if defined
-        Win XP (not roaming):   C:\Documents and Settings\<username>\Application Data\<AppAuthor>\<AppName>
-        Win XP (roaming):       C:\Documents and Settings\<username>\Local Settings\Application
-        Data\<AppAuthor>\<AppName>
-        Win 7  (not roaming):   C:\Users\<username>\AppData\Local\<AppAuthor>\<AppName>
-        Win 7  (roaming):       C:\Users\<username>\AppData\Roaming\<AppAuthor>\<AppName>
-
-        For Unix, we follow the XDG spec and support $XDG_DATA_HOME.
-        That means, by default "~/.local/share/<AppName>"."""
-
-        if SYSTEM == "win32":
-            if app_author is None:
-                app_author = app_name
-            const = roaming and "CSIDL_APPDATA" or "CSIDL_LOCAL_APPDATA"
-            path_ = Path(os.path.normpath(get_win_folder(const)))
-            if app_name:
-                if app_author is not False:
-                    path_ = path_ / app_author / app_name
-                else:
-                    path_ /= app_name
-        elif SYSTEM == "darwin":
-            path_ = Path.home() / "Library" / "Application Support"
-            if app_name:
-                path_ /= app_name
-        else:
-            path_ = Path(os.getenv("XDG_DATA_HOME", Path.home() / ".local" / "share"))
-            if app_name:
-                path_ /= app_name
-        if app_name and version:
-            path_ /= version
-        return path_
-
-    @staticmethod
-    def _site_data_path(
-        app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
-    ) -> Path:
-        r"""Return full path to the user-shared data dir for this application.
-
-        "app_name" is the name of application.
-        If None, just the system directory is returned.
-        "app_author" (only used on Windows) is the name of the
-        app_author or distributing body for this application. Typically
-        it is the owning company name. This falls back to app_name. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when app_name is present.
-        "multi_path" is an optional parameter only applicable to *nix
-        which indicates that the entire list of data dirs should be
-        returned. By default, the first item from XDG_DATA_DIRS is
-        returned, or '/usr/local/share/<AppName>',
-        if XDG_DATA_DIRS is not set
-
-        Typical site data directories are:
-        Mac OS X:   /Library/Application Support/<AppName>
-        Unix:       /usr/local/share/<AppName> or /usr/share/<AppName>
-        Win XP:     C:\Documents and Settings\All Users\Application Data\<AppAuthor>\<AppName>
-        Vista:      (Fail! "C:\ProgramData" is a hidden *system* directory on Vista.)
-        Win 7:      C:\ProgramData\<AppAuthor>\<AppName>   # Hidden, but writeable on Win 7.
-
-        For Unix, this is using the $XDG_DATA_DIRS[0] default.
-
-        WARNING: Do not use this on Windows. See the Vista-Fail note above for why."""
-        if SYSTEM == "win32":
-            if app_author is None:
-                app_author = app_name
-            path = Path(os.path.normpath(get_win_folder("CSIDL_COMMON_APPDATA")))
-            if app_name:
-                if app_author is not False:
-                    path = path / app_author / app_name
-                else:
-                    path /= app_name
-        elif SYSTEM == "darwin":
-            path = Path.home() / "Library" / "Application Support"
-            if app_name:
-                path /= app_name
-        else:
-            # XDG default for $XDG_DATA_DIRS
-            # only first, if multipath is False
-            path = os.getenv("XDG_DATA_DIRS", os.pathsep.join(["/usr/local/share", "/usr/share"]))
-            path_list = [os.path.expanduser(x.rstrip(os.sep)) for x in path.split(os.pathsep)]
-            if app_name:
-                if version:
-                    app_name = Path(app_name) / version
-                path_list = [Path(x) / app_name for x in path_list]
-
-            if multi_path:
-                path = os.pathsep.join([str(a) for a in path_list])
-            else:
-                path_list = [Path(a) for a in path_list]
-                path = path_list[0]
-            return path
-
-        if app_name and version:
-            path /= version
-        return path
-
-    @staticmethod
-    def _user_config_path(
-        app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
-    ) -> Path:
-        r"""Return full path to the user-specific config dir for this application.
-
-        "app_name" is the name of application.
-        If None, just the system directory is returned.
-        "app_author" (only used on Windows) is the name of the
-        app_author or distributing body for this application. Typically
-        it is the owning company name. This falls back to app_name. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when app_name is present.
-        "roaming" (boolean, default False) can be set True to use the Windows
-        roaming appdata directory. That means that for users on a Windows
-        network setup for roaming profiles, this user data will be
-        sync'd on login. See
-        <http://technet.microsoft.com/en-us/library/cc766489(WS.10).aspx>
-        for a discussion of issues.
-
-        Typical user config directories are:
-        Mac OS X:               ~/Library/Preferences/<AppName>
-        Unix:                   ~/.config/<AppName>     # or in $XDG_CONFIG_HOME, if defined
-        Win *:                  same as user_data_dir
-
-        For Unix, we follow the XDG spec and support $XDG_CONFIG_HOME.
-        That means, by default "~/.config/<AppName>"."""
-        if SYSTEM == "win32":
-            path = AppPath._user_data_path(app_name, app_author, None, roaming)
-        elif SYSTEM == "darwin":
-            path = Path.home() / "Library" / "Preferences"
-            if app_name:
-                path /= app_name
-        else:
-            path = Path(os.getenv("XDG_CONFIG_HOME", Path.home() / ".config"))
-            if app_name:
-                path /= app_name
-        if app_name and version:
-            path /= version
-        return path
-
-    @staticmethod
-    def _site_config_path(
-        app_name: str = None, app_author: str = None, version: str = None, multi_path: bool = False,
-    ) -> Path:
-        r"""Return full path to the user-shared data dir for this application.
-
-        "app_name" is the name of application.
-        If None, just the system directory is returned.
-        "app_author" (only used on Windows) is the name of the
-        app_author or distributing body for this application. Typically
-        it is the owning company name. This falls back to appname. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when app_name is present.
-        "multi_path" is an optional parameter only applicable to *nix
-        which indicates that the entire list of config dirs should be
-        returned. By default, the first item from XDG_CONFIG_DIRS is
-        returned, or '/etc/xdg/<AppName>', if XDG_CONFIG_DIRS is not set
-
-        Typical site config directories are:
-        Mac OS X:   same as site_data_dir
-        Unix:       /etc/xdg/<AppName> or $XDG_CONFIG_DIRS[i]/<AppName> for each value in
-        $XDG_CONFIG_DIRS
-        Win *:      same as site_data_dir
-        Vista:      (Fail! "C:\ProgramData" is a hidden *system* directory on Vista.)
-
-        For Unix, this is using the $XDG_CONFIG_DIRS[0] default, if multipath=False
-
-        WARNING: Do not use this on Windows. See the Vista-Fail note above for why."""
-        if SYSTEM == "win32":
-            path = AppPath._site_data_path(app_name, app_author)
-            if app_name and version:
-                path /= version
-        elif SYSTEM == "darwin":
-            path = Path.home() / "Library" / "Preferences"
-            if app_name:
-                path /= app_name
-        else:
-            # XDG default for $XDG_CONFIG_DIRS
-            # only first, if multi_path is False
-            path = os.getenv("XDG_CONFIG_DIRS", "/etc/xdg")
-            path_list = [os.path.expanduser(x.rstrip(os.sep)) for x in path.split(os.pathsep)]
-            if app_name:
-                if version:
-                    app_name = Path(app_name) / version
-                path_list = [Path(x) / app_name for x in path_list]
-
-            if multi_path:
-                path = os.pathsep.join([str(a) for a in path_list])
-            else:
-                # path_list = [Path(a) for a in path_list]
-                path = path_list[0]
-        return path
-
-    @staticmethod
-    def _user_cache_path(
-        app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
-    ) -> Path:
-        r"""Return full path to the user-specific cache dir for this application.
-
-        "appname" is the name of application.
-        If None, just the system directory is returned.
-        "appauthor" (only used on Windows) is the name of the
-        appauthor or distributing body for this application. Typically
-        it is the owning company name. This falls back to appname. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when appname is present.
-        "opinionated" (boolean) can be False to disable the appending of
-        "Cache" to the base app data dir for Windows. See
-        discussion below.
-
-        Typical user cache directories are:
-        Mac OS X:   ~/Library/Caches/<AppName>
-        Unix:       ~/.cache/<AppName> (XDG default)
-        Win XP:     C:\Documents and Settings\<username>\Local Settings\Application
-        Data\<AppAuthor>\<AppName>\Cache
-        Vista:      C:\Users\<username>\AppData\Local\<AppAuthor>\<AppName>\Cache
-
-        On Windows the only suggestion in the MSDN docs is that local settings go in
-        the `CSIDL_LOCAL_APPDATA` directory. This is identical to the non-roaming
-        app data dir (the default returned by `user_data_dir` above). Apps typically
-        put cache data somewhere *under* the given dir here. Some examples:
-        ...\Mozilla\Firefox\Profiles\<ProfileName>\Cache
-        ...\Acme\SuperApp\Cache\1.0
-        OPINION: This function appends "Cache" to the `CSIDL_LOCAL_APPDATA` value.
-        This can be disabled with the `opinionated=False` option."""
-        if SYSTEM == "win32":
-            if app_author is None:
-                app_author = app_name
-            path = Path(os.path.normpath(get_win_folder("CSIDL_LOCAL_APPDATA")))
-            if app_name:
-                if app_author is not False:
-                    path = path / app_author / app_name
-                else:
-                    path /= app_name
-                if opinionated:
-                    path /= "Cache"
-        elif SYSTEM == "darwin":
-            path = Path.home() / "Library" / "Caches"
-            if app_name:
-                path /= app_name
-        else:
-            path = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache"))
-            if app_name:
-                path /= app_name
-        if app_name and version:
-            path /= version
-        return path
-
-    @staticmethod
-    def _user_state_path(
-        app_name: str = None, app_author: str = None, version: str = None, roaming: bool = False,
-    ) -> Path:
-        r"""Return full path to the user-specific state dir for this application.
-
-        "app_name" is the name of application.
-        If None, just the system directory is returned.
-        "app_author" (only used on Windows) is the name of the
-        app_author or distributing body for this application. Typically
-        it is the owning company name. This falls back to appname. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when app_name is present.
-        "roaming" (boolean, default False) can be set True to use the Windows
-        roaming appdata directory. That means that for users on a Windows
-        network setup for roaming profiles, this user data will be
-        sync'd on login. See
-        <http://technet.microsoft.com/en-us/library/cc766489(WS.10).aspx>
-        for a discussion of issues.
-
-        Typical user state directories are:
-        Mac OS X:  same as user_data_dir
-        Unix:      ~/.local/state/<AppName>   # or in $XDG_STATE_HOME, if defined
-        Win *:     same as user_data_dir
-
-        For Unix, we follow this Debian proposal <https://wiki.debian.org/XDGBaseDirectorySpecification#state>
-        to extend the XDG spec and support $XDG_STATE_HOME.
+        return self._defer_ensurance(
+            self._user_log_path(self._app_name, self._app_author, version=self._app_version)
+        )
 
-        That means, by default "~/.local/state/<AppName>"."""
-        if SYSTEM in ["win32", "darwin"]:
-            path = AppPath._user_data_path(app_name, app_author, None, roaming)
-        else:
-            path = Path(os.getenv("XDG_STATE_HOME", Path.home() / ".local" / "state"))
-            if app_name:
-                path /= app_name
-        if app_name and version:
-            path /= version
-        return path
+    _PATH_PROPS = (
+        "user_data",
+        "user_config",
+        "user_cache",
+        "user_state",
+        "user_log",
+        "site_data",
+        "site_config",
+    )
 
     @staticmethod
-    def _user_log_path(
-        app_name: str = None, app_author: str = None, version: str = None, opinionated: bool = True,
-    ) -> Path:
-        r"""Return full path to the user-specific log dir for this application.
-
-        "app_name" is the name of application.
-        If None, just the system directory is returned.
-        "app_author" (only used on Windows) is the name of the
-        app_author or distributing body for this application. Typically
-        it is the owning company name. This falls back to appname. You may
-        pass False to disable it.
-        "version" is an optional version path element to append to the
-        path. You might want to use this if you want multiple versions
-        of your app to be able to run independently. If used, this
-        would typically be "<major>.<minor>".
-        Only applied when app_name is present.
-        "opinionated" (boolean) can be False to disable the appending of
-        "Logs" to the base app data dir for Windows, and "log" to the
-        base cache dir for Unix. See discussion below.
+    def clear_cache() -> None:
+        """
+        Drop the memoised builder results and environment lookups, so future accesses recompute
 
-        Typical user log directories are:
-        Mac OS X:   ~/Library/Logs/<AppName>
-        Unix:       ~/.cache/<AppName>/log  # or under $XDG_CACHE_HOME if defined
-        Win XP:     C:\Documents and Settings\<username>\Local Settings\Application
-        Data\<AppAuthor>\<AppName>\Logs
-        Vista:      C:\Users\<username>\AppData\Local\<AppAuthor>\<AppName>\Logs
+        :return:
+        :rtype:"""
+        reset_env_cache()
 
-        On Windows the only suggestion in the MSDN docs is that local settings
-        go in the `CSIDL_LOCAL_APPDATA` directory. (Note: I'm interested in
-        examples of what some windows apps use for a logs dir.)
-
-        OPINION: This function appends "Logs" to the `CSIDL_LOCAL_APPDATA`
-        value for Windows and appends "log" to the user cache dir for Unix.
-        This can be disabled with the `opinionated=False` option."""
-        if SYSTEM == "darwin":
-            path = Path.home() / "Library" / "Logs" / app_name
-        elif SYSTEM == "win32":
-            path = AppPath._user_data_path(app_name, app_author, version)
-            version = False
-            if opinionated:
-                path /= "Logs"
-        else:
-            path = AppPath._user_cache_path(app_name, app_author, version)
-            version = False
-            if opinionated:
-                path /= "log"
-        if app_name and version:
-            path /= version
-        return path
+    def ensure_all(self) -> None:
+        """
+        Create every AppPath directory in one batch. The paths are computed with ensure-on-access
+        suspended, paths that are parents of other computed paths are dropped, and a single os.makedirs
+        per remaining leaf creates any shared parents exactly once
 
-    def clean(self, confirm: bool = True) -> None:
+        :return:
+        :rtype:"""
+        with self._existence_ensurance_suspended():
+            paths = set()
+            for prop_name in self._PATH_PROPS:
+                path = getattr(self, prop_name)
+                if isinstance(path, Path):
+                    paths.add(path)
+        for path in paths:
+            if not any(path in other.parents for other in paths if other is not path):
+                os.makedirs(path, exist_ok=True)
+
+    # The platform appropriate builder is chosen once at import time (see the module level dispatch above);
+    # the staticmethod aliases keep the previous call sites working.
+    _user_data_path = staticmethod(_user_data_path)
+    _site_data_path = staticmethod(_site_data_path)
+    _user_config_path = staticmethod(_user_config_path)
+    _site_config_path = staticmethod(_site_config_path)
+    _user_cache_path = staticmethod(_user_cache_path)
+    _user_state_path = staticmethod(_user_state_path)
+    _user_log_path = staticmethod(_user_log_path)
+
+    _CLEANED_PROPS = (  # user_state is deliberately not cleaned, matching the historical behaviour
+        "user_log",
+        "user_config",
+        "user_data",
+        "user_cache",
+        "site_config",
+        "site_data",
+    )
+
+    def clean(self, confirm: bool = True, parallel: bool = True, background: bool = False) -> None:
         """
 
             Remove all apppath data
 
+        Some of the trees nest inside others (user_log lives under user_cache on posix and under
+        user_data on win32, where site_config also sits inside site_data), so nested paths are dropped
+        and only the outermost trees are deleted, by default concurrently on a thread pool; threads
+        suffice because the work is syscall-bound. The paths are computed up front in the calling
+        thread, keeping the ensure-on-access suspension single-threaded. With background=True each tree
+        is instead renamed aside and bulk-deleted on a daemon thread, so the call returns as soon as the
+        renames land
+
         :param confirm:
-        :type confirm:"""
-        if confirm:
+        :type confirm:
+        :param parallel:
+        :type parallel:
+        :param background:
+        :type background:"""
+        if not confirm:
+            return
+        if not parallel and not background:
             self.clean_user_log()
             self.clean_user_config()
             self.clean_user_data()
             self.clean_user_cache()
             self.clean_site_config()
             self.clean_site_data()
+            return
+        with self._existence_ensurance_suspended():
+            paths = {getattr(self, prop_name) for prop_name in self._CLEANED_PROPS}
+        # Removing an outer tree already removes any tree nested inside it, so drop the nested ones
+        # (the inverse of the containment filter in ensure_all) rather than racing a delete of a tree
+        # against a delete of its own subtree.
+        paths = [path for path in paths if not any(other in path.parents for other in paths)]
+        if background:
+            for path in paths:
+                background_rmtree(path)
+        else:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=len(paths)) as executor:
+                for future in [executor.submit(fast_rmtree, path) for path in paths]:
+                    future.result()
+        for prop_name in self._CLEANED_PROPS:
+            self._path_cache.pop(prop_name, None)
+        ensure_existence.cache_clear()  # the removed trees are no longer ensured
+
+    def _defer_ensurance(self, path: Path) -> Path:
+        """
+        When ensure-on-access is enabled, wrap the computed path in an _EnsuredPath that creates it on
+        first filesystem access; otherwise return it untouched
+
+        :param path:
+        :type path:"""
+        if self._ensure_existence:
+            path = _EnsuredPath(path)
+            path._ensure_pending = True
+            path._sanitise_func = self._sanitise_func
+        return path
+
+    @contextlib.contextmanager
+    def _existence_ensurance_suspended(self):
+        """
+        Temporarily disable ensure_existence_on_access, so that reading a property for deletion does not
+        first recreate the very directory that is about to be removed"""
+        previous = self._ensure_existence
+        self._ensure_existence = False
+        try:
+            yield
+        finally:
+            self._ensure_existence = previous
+
+    def _clean(self, prop_name: str) -> None:
+        """
+        Remove the directory behind a cached path property and drop the cached value, so the next access
+        recomputes (and optionally recreates) it
+
+        :param prop_name:
+        :type prop_name:"""
+        with self._existence_ensurance_suspended():
+            path = getattr(self, prop_name)
+        fast_rmtree(path)
+        self._path_cache.pop(prop_name, None)
+        ensure_existence.cache_clear()  # the removed tree is no longer ensured
 
     def clean_user_log(self) -> None:
         """"""
-        if self.user_log.exists():
-            shutil.rmtree(self.user_log)
+        self._clean("user_log")
 
     def clean_user_config(self) -> None:
         """"""
-        if self.user_config.exists():
-            shutil.rmtree(self.user_config)
+        self._clean("user_config")
 
     def clean_user_data(self) -> None:
         """"""
-        if self.user_data.exists():
-            shutil.rmtree(self.user_data)
+        self._clean("user_data")
 
     def clean_user_cache(self) -> None:
         """"""
-        if self.user_cache.exists():
-            shutil.rmtree(self.user_cache)
+        self._clean("user_cache")
 
     def clean_site_config(self) -> None:
         """"""
-        if self.site_config.exists():
-            shutil.rmtree(self.site_config)
+        self._clean("site_config")
 
     def clean_site_data(self) -> None:
         """"""
-        if self.site_data.exists():
-            shutil.rmtree(self.site_data)
+        self._clean("site_data")
 
     @property
     def app_name(self):
@@ -649,6 +895,8 @@ if __name__ == "__main__":
 
     def main():
         """"""
+        from operator import attrgetter
+
         _app_name = "MyApp"
         _app_author = __author__
 
@@ -661,26 +909,31 @@ if __name__ == "__main__":
             "site_data",
             "site_config",
         )
+        getters = tuple(zip(props, map(attrgetter, props)))  # avoids repeated getattr string lookups
+
+        def describe(header: str, dirs: AppPath) -> None:
+            """"""
+            print(header)
+            for prop, get in getters:
+                print(f"{prop}: {get(dirs)}")
 
-        print("-- app dirs (with optional 'version')")
-        dirs = AppPath(_app_name, _app_author, app_version="1.0", ensure_existence_on_access=False)
-        for prop in props:
-            print(f"{prop}: {getattr(dirs, prop)}")
+        describe(
+            "-- app dirs (with optional 'version')",
+            AppPath(_app_name, _app_author, app_version="1.0", ensure_existence_on_access=False),
+        )
 
-        print("\n-- app dirs (without optional 'version')")
-        dirs = AppPath(_app_name, _app_author, ensure_existence_on_access=False)
-        for prop in props:
-            print(f"{prop}: {getattr(dirs, prop)}")
+        describe(
+            "\n-- app dirs (without optional 'version')",
+            AppPath(_app_name, _app_author, ensure_existence_on_access=False),
+        )
 
-        print("\n-- app dirs (without optional '_app_author')")
-        dirs = AppPath(_app_name, ensure_existence_on_access=False)
-        for prop in props:
-            print(f"{prop}: {getattr(dirs, prop)}")
+        describe(
+            "\n-- app dirs (without optional '_app_author')",
+            AppPath(_app_name, ensure_existence_on_access=False),
+        )
 
-        print("\n-- app dirs (with disabled '_app_author')")
         dirs = AppPath(_app_name, ensure_existence_on_access=False)
-        for prop in props:
-            print(f"{prop}: {getattr(dirs, prop)}")
+        describe("\n-- app dirs (with disabled '_app_author')", dirs)
 
         ex = None
         try:
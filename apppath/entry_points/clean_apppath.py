@@ -1,15 +1,21 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 import argparse
+from operator import attrgetter
 from shutil import rmtree
 
-from apppath import AppPath
-
 __author__ = "Christian Heider Nielsen"
 __doc__ = r"""This script will clean a apppath directory of an app"""
 
+_DIR_DISPATCH = {
+    "data": attrgetter("user_data"),
+    "config": attrgetter("user_config"),
+    "cache": attrgetter("user_cache"),
+    "logs": attrgetter("user_log"),
+}
 
-def clean_arg():
+
+def _build_parser() -> argparse.ArgumentParser:
     """"""
     parser = argparse.ArgumentParser(description="Apppath Clean Path")
     parser.add_argument("APP_NAME", metavar="Name", type=str, help="App name to clean AppPath for")
@@ -21,20 +27,25 @@ def clean_arg():
         metavar="DIR",
         help="Which AppPath directory to clean (default: 'cache')",
     )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def clean_arg():
+    """"""
+    args = _PARSER.parse_args()
+
+    # Deferred so --help/usage errors answer without paying for platform detection
+    from apppath import AppPath
 
-    args = parser.parse_args()
     project_app_path = AppPath(args.APP_NAME)
 
-    if args.DIR == "data":
-        directory = project_app_path.user_data
-    elif args.DIR == "config":
-        directory = project_app_path.user_config
-    elif args.DIR == "cache":
-        directory = project_app_path.user_cache
-    elif args.DIR == "logs":
-        directory = project_app_path.user_log
-    else:
+    getter = _DIR_DISPATCH.get(args.DIR)
+    if getter is None:
         raise NotADirectoryError(args.DIR)
+    directory = getter(project_app_path)
 
     print(f"Wiping {directory}")
     if directory.exists():
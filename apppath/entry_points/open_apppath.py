@@ -2,16 +2,11 @@
 # -*- coding: utf-8 -*-
 import argparse
 
-
-from apppath import AppPath
-
 __author__ = "Christian Heider Nielsen"
 __doc__ = r"""This script will open data the directory of an app"""
 
-from apppath.system_open_path_utilities import AppPathSubDirEnum, open_app_path
-
 
-def open_arg():
+def _build_parser() -> argparse.ArgumentParser:
     """"""
     parser = argparse.ArgumentParser(description="Apppath Open Path")
     parser.add_argument("APP_NAME", metavar="Name", type=str, help="App name to open AppPath for")
@@ -31,8 +26,20 @@ def open_arg():
         metavar="DIR",
         help="Which AppPath directory to open (default: 'data')",
     )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+def open_arg():
+    """"""
+    args = _PARSER.parse_args()
+
+    # Deferred so --help/usage errors answer without paying for platform detection
+    from apppath import AppPath
+    from apppath.system_open_path_utilities import AppPathSubDirEnum, open_app_path
 
-    args = parser.parse_args()
     project_app_path = AppPath(args.APP_NAME)
 
     open_app_path(project_app_path, AppPathSubDirEnum(args.DIR), args.SITE)
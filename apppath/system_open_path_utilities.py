@@ -7,11 +7,36 @@ __doc__ = r"""
            Created on 31-01-2021
            """
 
+import os
+import shutil
 import subprocess
 import sys
 from enum import Enum
+from operator import attrgetter
 from pathlib import Path
 
+# The opener is bound once at import instead of re-comparing sys.platform per call: os.startfile on
+# Windows (direct ShellExecuteW, no cmd.exe for "start"), otherwise a posix_spawn of the open/xdg-open
+# binary located via shutil.which (spawn skips duplicating the Python heap the way a plain fork through
+# Popen would), with Popen kept as the fallback when the binary is not on PATH.
+if sys.platform == "win32":
+    _OPENER = os.startfile
+else:
+    _OPEN_COMMAND = "open" if sys.platform == "darwin" else "xdg-open"
+    _OPEN_BINARY = shutil.which(_OPEN_COMMAND)
+    if _OPEN_BINARY is None:
+
+        def _OPENER(directory: str) -> None:
+            """"""
+            subprocess.Popen([_OPEN_COMMAND, directory])
+
+    else:
+
+        def _OPENER(directory: str) -> None:
+            """"""
+            os.posix_spawn(_OPEN_BINARY, [_OPEN_BINARY, directory], os.environ)
+
+
 from apppath.app_path import AppPath
 
 __all__ = ["AppPathSubDirEnum", "open_app_path", "system_open_path"]
@@ -24,46 +49,40 @@ class AppPathSubDirEnum(Enum):
     log = "log"
 
 
+# Sub-dir to AppPath property, precomputed so open_app_path is a dict lookup instead of an if/elif walk;
+# the site table doubles as the source of valid site options.
+_USER_DISPATCH = {
+    AppPathSubDirEnum.data: attrgetter("user_data"),
+    AppPathSubDirEnum.config: attrgetter("user_config"),
+    AppPathSubDirEnum.cache: attrgetter("user_cache"),
+    AppPathSubDirEnum.log: attrgetter("user_log"),
+}
+_SITE_DISPATCH = {
+    AppPathSubDirEnum.data: attrgetter("site_data"),
+    AppPathSubDirEnum.config: attrgetter("site_config"),
+}
+
+
 def system_open_path(path: Path, *, verbose: bool = False) -> None:
     """"""
     directory = str(path)
     if verbose:
         print(f"Opening the directory ({directory}) using the systems default file manager")
 
-    if sys.platform == "win32":
-        subprocess.Popen(["start", directory], shell=True)
-
-    elif sys.platform == "darwin":
-        subprocess.Popen(["open", directory])
-
-    else:
-        # try:
-        subprocess.Popen(["xdg-open", directory])
-        # except OSError:
+    _OPENER(directory)
 
 
 def open_app_path(
     app_path: AppPath, sub_dir: AppPathSubDirEnum, site: bool = False, verbose: bool = False,
 ) -> None:
     """"""
-    if not site:
-        if sub_dir == AppPathSubDirEnum.data:
-            directory = app_path.user_data
-        elif sub_dir == AppPathSubDirEnum.config:
-            directory = app_path.user_config
-        elif sub_dir == AppPathSubDirEnum.cache:
-            directory = app_path.user_cache
-        elif sub_dir == AppPathSubDirEnum.log:
-            directory = app_path.user_log
-        else:
-            raise NotADirectoryError(f"{sub_dir} not in user options (data,config,cache,logs)")
-    else:
-        if sub_dir == AppPathSubDirEnum.data:
-            directory = app_path.site_data
-        elif sub_dir == AppPathSubDirEnum.config:
-            directory = app_path.site_config
-        else:
-            raise NotADirectoryError(f"{sub_dir} not in site options (data,config)")
+    dispatch = _SITE_DISPATCH if site else _USER_DISPATCH
+    getter = dispatch.get(sub_dir)
+    if getter is None:
+        raise NotADirectoryError(
+            f"{sub_dir} not in {'site' if site else 'user'} options ({','.join(o.value for o in dispatch)})"
+        )
+    directory = getter(app_path)
 
     if verbose:
         print(
@@ -7,13 +7,26 @@ __doc__ = r"""
            Created on 08/03/2020
            """
 
-__all__ = ["ensure_existence", "path_rmtree", "sanitise_path"]
+__all__ = ["background_rmtree", "ensure_existence", "fast_rmtree", "path_rmtree", "sanitise_path"]
 
 from itertools import cycle
 from pathlib import Path
 from shutil import rmtree
 from typing import Iterable, Union
 import os
+import stat
+import subprocess
+import threading
+from uuid import uuid4
+
+from .windows_path_utilities import SYSTEM
+
+# Native tree remover, chosen once per platform. One fork/exec replaces the per-entry Python-level
+# unlink/rmdir syscalls, which dominates on large cache/log trees.
+if SYSTEM == "win32":
+    _NATIVE_RM_ARGV = ("cmd", "/c", "rd", "/s", "/q")
+else:
+    _NATIVE_RM_ARGV = ("rm", "-rf", "--")
 
 
 # from warg import passes_kws_to
@@ -29,6 +42,115 @@ def path_rmtree(path: Path, **kwargs) -> None:
     rmtree(str(path), **kwargs)
 
 
+def _scandir_rmtree(path: str) -> None:
+    """
+    Bottom-up removal walk; DirEntry.is_dir(follow_symlinks=False) reuses the d_type returned by the
+    directory listing, so entries are classified without a separate stat each
+
+    :param path:
+    :type path:"""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                _scandir_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+    os.rmdir(path)
+
+
+def _fd_rmtree_below(fd: int) -> None:
+    """
+    Empty the directory behind an open fd, unlinking entries relative to it so the kernel resolves each
+    name against the open directory instead of re-walking the full path per entry
+
+    :param fd:
+    :type fd:"""
+    with os.scandir(fd) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                child = os.open(entry.name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=fd)
+                try:
+                    _fd_rmtree_below(child)
+                finally:
+                    os.close(child)
+                os.rmdir(entry.name, dir_fd=fd)
+            else:
+                os.unlink(entry.name, dir_fd=fd)
+
+
+def _fd_rmtree(path: str) -> None:
+    """
+    Bottom-up removal walk with openat-style dir_fd resolution, amortising path lookups on deep trees
+
+    :param path:
+    :type path:"""
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        _fd_rmtree_below(fd)
+    finally:
+        os.close(fd)
+    os.rmdir(path)
+
+
+# Python-level fallback walk, chosen once: the dir_fd variant where the platform supports it (Linux and
+# friends), the plain scandir walk otherwise.
+if {os.open, os.unlink, os.rmdir} <= os.supports_dir_fd and os.scandir in os.supports_fd:
+    _py_rmtree = _fd_rmtree
+else:
+    _py_rmtree = _scandir_rmtree
+
+
+def fast_rmtree(path: Union[Path, str]) -> None:
+    """
+    Remove a directory tree like shutil.rmtree(ignore_errors=True). The platform native remover is tried
+    first; when it is unavailable the tree is walked with os.scandir (halving the lstat syscalls), and
+    any other failure falls back to shutil.rmtree for safety. A missing tree is a no-op
+
+    :param path:
+    :type path:"""
+    path_str = os.fspath(path)
+    try:
+        if (
+            subprocess.run(
+                (*_NATIVE_RM_ARGV, path_str),
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            ).returncode
+            == 0
+        ):
+            return
+    except OSError:  # remover binary unavailable
+        pass
+    try:
+        _py_rmtree(path_str)
+    except FileNotFoundError:
+        pass
+    except OSError:
+        rmtree(path_str, ignore_errors=True)
+
+
+def background_rmtree(path: Union[Path, str]) -> None:
+    """
+    Remove a directory tree off the critical path: the tree is renamed to a sibling .trash-<uuid> name
+    (a same-filesystem rename is one atomic syscall, so the original name is reclaimed immediately) and
+    the bulk delete runs on a daemon thread. A missing tree is a no-op; when the rename itself fails the
+    tree is removed in place synchronously
+
+    :param path:
+    :type path:"""
+    path = Path(path)
+    trash = path.with_name(f"{path.name}.trash-{uuid4().hex}")
+    try:
+        os.rename(path, trash)
+    except FileNotFoundError:
+        return
+    except OSError:
+        fast_rmtree(path)
+        return
+    threading.Thread(target=fast_rmtree, args=(trash,), daemon=True).start()
+
+
 def sanitise_path(
     path: Path,
     naughty_directory_symbols: Iterable[str] = (
@@ -72,6 +194,12 @@ def sanitise_path(
     return path_out
 
 
+# Paths already ensured by this process; ensuring the same directory again would just repeat the
+# stat/mkdir syscalls, so subsequent calls short-circuit. Call ensure_existence.cache_clear() after
+# removing a previously ensured path.
+_ensured_paths = set()
+
+
 def ensure_existence(
     out: Union[Path, str],
     *,
@@ -107,37 +235,52 @@ def ensure_existence(
         if sanitisation_func:
             out = sanitisation_func(out)
 
-        if not out.parent.exists():
-            if verbose:
-                print("Creating parents")
-            out.parent.mkdir(parents=True, exist_ok=True)
-
-        if out.is_file() or ("." in out.name and ".d" not in out.name) or declare_file:
-            if (
-                out.exists()
-                and (out.is_dir() or ("." not in out.name and ".d" in out.name))
-                and ((declare_file and overwrite_on_wrong_type) or force_overwrite)
-            ):
-                if verbose:
-                    print("Removing tree")
-                path_rmtree(out)
-            if out.is_file() and not out.exists():
-                out.touch(exist_ok=True)
+        key = str(out)
+        if key in _ensured_paths and not (overwrite_on_wrong_type or force_overwrite):
+            return out
+
+        # The name classification is computed once and the exists()/is_file() prechecks are gone:
+        # mkdir(parents=True, exist_ok=True)/touch(exist_ok=True) are cheap no-ops when the target is
+        # already there, so the common path costs a single syscall instead of a stat per probe.
+        name = out.name
+        is_file_like = declare_file or ("." in name and not name.endswith(".d"))
+        out.parent.mkdir(parents=True, exist_ok=True)
+
+        # The overwrite flags are tested before touching the filesystem, so the common no-overwrite path
+        # performs no stat at all; when they are set, a single lstat classifies the target instead of
+        # separate exists()/is_dir()/is_file() round-trips.
+        if is_file_like:
+            if (declare_file and overwrite_on_wrong_type) or force_overwrite:
+                try:
+                    if stat.S_ISDIR(os.lstat(out).st_mode):
+                        if verbose:
+                            print("Removing tree")
+                        path_rmtree(out)
+                except OSError:
+                    pass
+            out.touch(exist_ok=True)
         else:
-            if (
-                out.exists()
-                and out.is_file()
-                and ((not declare_file and overwrite_on_wrong_type) or force_overwrite)
-            ):
-                if verbose:
-                    print("Deleting file")
-                out.unlink()  # missing_ok=True)
-            if not out.exists():
+            if (not declare_file and overwrite_on_wrong_type) or force_overwrite:
+                try:
+                    if stat.S_ISREG(os.lstat(out).st_mode):
+                        if verbose:
+                            print("Deleting file")
+                        out.unlink()  # missing_ok=True)
+                except OSError:
+                    pass
+            try:
                 out.mkdir(parents=True, exist_ok=True)
+            except FileExistsError:  # a file already occupies the path; preserved unless overwriting
+                pass
+
+        _ensured_paths.add(key)
 
     return out
 
 
+ensure_existence.cache_clear = _ensured_paths.clear
+
+
 if __name__ == "__main__":
 
     def main():
@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import functools
+import importlib.util
 import sys
 
 __author__ = "Christian Heider Nielsen"
@@ -50,12 +52,7 @@ def _get_win_folder_with_pywin32(csidl_name: Any) -> Any:
 
         # Downgrade to short path name if have highbit chars. See
         # <http://bugs.activestate.com/show_bug.cgi?id=85099>.
-        has_high_char = False
-        for c in dir:
-            if ord(c) > 255:
-                has_high_char = True
-                break
-        if has_high_char:
+        if any(c > "\xff" for c in dir):
             try:
                 import win32api
 
@@ -81,12 +78,7 @@ def _get_win_folder_with_ctypes(csidl_name: Any) -> Any:
 
     # Downgrade to short path name if have highbit chars. See
     # <http://bugs.activestate.com/show_bug.cgi?id=85099>.
-    has_high_char = False
-    for c in buf:
-        if ord(c) > 255:
-            has_high_char = True
-            break
-    if has_high_char:
+    if any(c > "\xff" for c in buf.value):
         buf2 = create_unicode_buffer(1024)
         if windll.kernel32.GetShortPathNameW(buf.value, buf2, 1024):
             buf = buf2
@@ -113,12 +105,7 @@ def _get_win_folder_with_jna(csidl_name: Any) -> Any:
 
     # Downgrade to short path name if have highbit chars. See
     # <http://bugs.activestate.com/show_bug.cgi?id=85099>.
-    has_high_char = False
-    for c in dir:
-        if ord(c) > 255:
-            has_high_char = True
-            break
-    if has_high_char:
+    if any(c > "\xff" for c in dir):
         buf = array.zeros("c", buf_size)
         kernel = win32.Kernel32.INSTANCE
         if kernel.GetShortPathName(dir, buf, buf_size):
@@ -145,20 +132,35 @@ if sys.platform.startswith("java"):
 else:
     SYSTEM = sys.platform
 
-if SYSTEM == "win32":  # IMPORT TESTS
-    try:
-        from win32com import shell
-
-        get_win_folder = _get_win_folder_with_pywin32
-    except ImportError:
-        try:
-            from ctypes import windll
-
-            get_win_folder = _get_win_folder_with_ctypes
-        except ImportError:
-            try:
-                from com.sun import jna
 
-                get_win_folder = _get_win_folder_with_jna
-            except ImportError:
-                get_win_folder = _get_win_folder_from_registry
+def _module_available(name: str) -> bool:
+    """importlib.util.find_spec checks availability without executing the module"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+if SYSTEM == "win32":
+
+    @functools.lru_cache(maxsize=None)
+    def _pick_win_folder_impl() -> Any:
+        """
+        Choose the first available implementation, probed on first use rather than at import so that
+        merely importing apppath does not load the pywin32/ctypes DLLs"""
+        if _module_available("win32com.shell"):
+            return _get_win_folder_with_pywin32
+        if _module_available("ctypes"):
+            return _get_win_folder_with_ctypes
+        if _module_available("com.sun.jna"):
+            return _get_win_folder_with_jna
+        return _get_win_folder_from_registry
+
+    # The CSIDL folders are stable for the process lifetime while every lookup goes through the
+    # shell/registry, so memoise per constant; the key space is ~3 entries.
+    @functools.lru_cache(maxsize=8)
+    def _get_win_folder_cached(csidl_name: Any) -> Any:
+        """Resolve a CSIDL_* constant to its folder through the lazily picked implementation"""
+        return _pick_win_folder_impl()(csidl_name)
+
+    get_win_folder = _get_win_folder_cached
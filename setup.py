@@ -1,29 +1,26 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import sys
 from typing import List, Sequence, Union
 
 
 def python_version_check(major: int = 3, minor: int = 7):
     """"""
-    import sys
-
     assert sys.version_info.major == major and sys.version_info.minor >= minor, (
         f"This project is utilises language features only present Python {major}.{minor} and greater. "
         f"You are running {sys.version_info}."
     )
 
 
-python_version_check()
-
 from pathlib import Path
 
 
 def read_reqs(file: str, path: Path) -> List[str]:
     """"""
 
-    def readlines_ignore_comments(f):
-        """"""
-        return [a_ for a_ in f.readlines() if "#" not in a_ and a_]
+    def lines_ignore_comments(text: str) -> List[str]:
+        """One slurped read split and stripped in a single comprehension, blank lines dropped"""
+        return [line.strip() for line in text.splitlines() if line.strip() and "#" not in line]
 
     def recursive_flatten_ignore_str(seq: Sequence) -> Sequence:
         """"""
@@ -41,43 +38,83 @@ def read_reqs(file: str, path: Path) -> List[str]:
     def unroll_nested_reqs(req_str: str, base_path: Path):
         """"""
         if req_str.startswith("-r"):
-            with open(base_path / req_str.strip("-r").strip()) as f:
-                return [unroll_nested_reqs(req.strip(), base_path) for req in readlines_ignore_comments(f)]
+            nested = (base_path / req_str[len("-r") :].strip()).read_text()
+            return [unroll_nested_reqs(req, base_path) for req in lines_ignore_comments(nested)]
         else:
             return (req_str,)
 
     requirements_group = []
-    with open(str(path / file)) as f:
-        requirements = readlines_ignore_comments(f)
-        for requirement in requirements:
-            requirements_group.extend(
-                recursive_flatten_ignore_str(unroll_nested_reqs(requirement.strip(), path))
-            )
+    for requirement in lines_ignore_comments((path / file).read_text()):
+        requirements_group.extend(recursive_flatten_ignore_str(unroll_nested_reqs(requirement, path)))
 
     req_set = set(requirements_group)
     req_set.discard("")
     return list(req_set)
 
 
+import os
 import re
 
+try:
+    from functools import cached_property
+except ImportError:  # Python < 3.8: recompute on every access instead of caching
+    cached_property = property
+
 from setuptools import find_packages, setup
 
-with open(Path(__file__).parent / "apppath" / "__init__.py", "r") as project_init_file:
-    str_reg_exp = "['\"]([^'\"]*)['\"]"
-    content = project_init_file.read()  # get strings from module
-    version = re.search(rf"__version__ = {str_reg_exp}", content, re.M).group(1)
-    project_name = re.search(rf"__project__ = {str_reg_exp}", content, re.M).group(1)
-    author = re.search(rf"__author__ = {str_reg_exp}", content, re.M).group(1)
+# One compiled pattern and one scan of the init file collects every dunder assignment, instead of
+# re-building and re-running a pattern per field.
+_META_RE = re.compile(r"^__(\w+)__ = ['\"]([^'\"]*)['\"]", re.M)
+
+# read_text takes the slurp-whole-file fast path without BufferedReader setup/teardown
+meta = dict(
+    _META_RE.findall((Path(__file__).parent / "apppath" / "__init__.py").read_text(encoding="utf-8"))
+)  # get strings from module
+version = meta["version"]
+project_name = meta["project"]
+author = meta["author"]
 __author__ = author
 
 
+# Literal metadata hoisted to module scope, so every access hands setup() the same prebuilt object
+# instead of re-allocating the list/dict from the literals.
+_PACKAGE_DATA = {
+    # 'PackageName':[
+    # *data
+    #  ]
+}
+
+_ENTRY_POINTS = {
+    "console_scripts": [
+        # "name_of_executable = module.with:function_to_execute"
+        "apppath-open=apppath.entry_points.open_apppath:open_arg",
+        "apppath-clean=apppath.entry_points.clean_apppath:clean_arg",
+    ]
+}
+
+_CLASSIFIERS = [
+    "Development Status :: 4 - Beta",
+    "Environment :: Console",
+    "Intended Audience :: End Users/Desktop",
+    "Intended Audience :: Developers",
+    "License :: OSI Approved :: Apache Software License",
+    "Operating System :: MacOS :: MacOS X",
+    "Operating System :: Microsoft :: Windows",
+    "Operating System :: POSIX",
+    "Operating System :: OS Independent",
+    "Programming Language :: Python :: 3",
+    "Natural Language :: English",
+    # 'Topic :: Scientific/Engineering :: Artificial Intelligence'
+    # 'Topic :: Software Development :: Bug Tracking',
+]
+
+
 class AppPathPackage:
-    @property
+    @cached_property
     def test_dependencies(self) -> list:
         return read_reqs("requirements_tests.txt", Path(__file__).parent / "requirements")
 
-    @property
+    @cached_property
     def setup_dependencies(self) -> list:
         """"""
         return read_reqs("requirements_setup.txt", Path(__file__).parent / "requirements")
@@ -102,7 +139,7 @@ class AppPathPackage:
         """"""
         return "text/markdown"
 
-    @property
+    @cached_property
     def packages(self) -> List[Union[bytes, str]]:
         """"""
         return find_packages(
@@ -135,24 +172,14 @@ class AppPathPackage:
     def package_data(self) -> dict:
         """"""
         # data = glob.glob('data/', recursive=True)
-        return {
-            # 'PackageName':[
-            # *data
-            #  ]
-        }
+        return _PACKAGE_DATA
 
     @property
     def entry_points(self) -> dict:
         """"""
-        return {
-            "console_scripts": [
-                # "name_of_executable = module.with:function_to_execute"
-                "apppath-open=apppath.entry_points.open_apppath:open_arg",
-                "apppath-clean=apppath.entry_points.clean_apppath:clean_arg",
-            ]
-        }
+        return _ENTRY_POINTS
 
-    @property
+    @cached_property
     def extras(self) -> dict:
         """"""
         these_extras = {
@@ -161,10 +188,14 @@ class AppPathPackage:
 
         path: Path = Path(__file__).parent / "requirements"
 
-        for file in path.iterdir():
-            if file.name.startswith("requirements_"):
-                group_name_ = "_".join(file.name.strip(".txt").split("_")[1:])
-                these_extras[group_name_] = read_reqs(file.name, path)
+        # scandir filters on the listed names without a stat per entry; slicing the suffix off avoids
+        # str.strip(".txt"), which strips characters and mangled group names ending in t/x
+        with os.scandir(path) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.startswith("requirements_") and name.endswith(".txt"):
+                    group_name_ = "_".join(name[: -len(".txt")].split("_")[1:])
+                    these_extras[group_name_] = read_reqs(name, path)
 
         all_dependencies = []
         for group_name in these_extras:
@@ -173,7 +204,7 @@ class AppPathPackage:
 
         return these_extras
 
-    @property
+    @cached_property
     def requirements(self) -> list:
         """"""
         return read_reqs("requirements.txt", Path(__file__).parent)
@@ -183,17 +214,15 @@ class AppPathPackage:
         """"""
         return "A package for easing return of multiple values"
 
-    @property
+    @cached_property
     def readme(self) -> str:
         """"""
-        with open("README.md", encoding="utf8") as f:
-            return f.read()
+        return Path("README.md").read_text(encoding="utf8")
 
-    @property
+    @cached_property
     def keyword(self) -> str:
         """"""
-        with open("KEYWORDS.md") as f:
-            return f.read()
+        return Path("KEYWORDS.md").read_text()
 
     @property
     def license(self) -> str:
@@ -203,21 +232,7 @@ class AppPathPackage:
     @property
     def classifiers(self) -> List[str]:
         """"""
-        return [
-            "Development Status :: 4 - Beta",
-            "Environment :: Console",
-            "Intended Audience :: End Users/Desktop",
-            "Intended Audience :: Developers",
-            "License :: OSI Approved :: Apache Software License",
-            "Operating System :: MacOS :: MacOS X",
-            "Operating System :: Microsoft :: Windows",
-            "Operating System :: POSIX",
-            "Operating System :: OS Independent",
-            "Programming Language :: Python :: 3",
-            "Natural Language :: English",
-            # 'Topic :: Scientific/Engineering :: Artificial Intelligence'
-            # 'Topic :: Software Development :: Bug Tracking',
-        ]
+        return _CLASSIFIERS
 
     @property
     def version(self) -> str:
@@ -226,6 +241,7 @@ class AppPathPackage:
 
 
 if __name__ == "__main__":
+    python_version_check()
 
     pkg = AppPathPackage()
 
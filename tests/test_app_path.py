@@ -1,10 +1,14 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
+import sys
+
 import pytest
 
 __author__ = "Christian Heider Nielsen"
 __doc__ = ""
 
+from operator import attrgetter
+
 from apppath import app_path
 
 props = (
@@ -16,46 +20,47 @@ props = (
     "site_data",
     "site_config",
 )
+_get_props = attrgetter(*props)  # resolves every property in one call instead of a getattr per name
 
 
-@pytest.mark.parametrize(
-    ["app_name", "app_author"], (("MyApp", "cnheider"), ("YourApp", "you")), ids=["my", "you"],
-)
-def test_all(app_name: str, app_author: str):
-    print("-- app dirs (with optional 'version')")
-    dirs = app_path.AppPath(app_name, app_author, app_version="1.0", ensure_existence_on_access=False)
-    for prop in props:
-        print(f"{prop}: {getattr(dirs, prop)}")
-    dirs.clean()
+def _dump_props(dirs) -> None:
+    """One stdout write for all properties instead of a lock-and-flush print per line"""
+    sys.stdout.write("\n".join(f"{prop}: {value}" for prop, value in zip(props, _get_props(dirs))) + "\n")
+
+
+@pytest.fixture
+def make_dirs():
+    """AppPath factory; ensure-on-access is disabled, so no directory is ever created and no cleanup
+    teardown is needed"""
+
+    def _make(*args, **kwargs):
+        """"""
+        return app_path.AppPath(*args, ensure_existence_on_access=False, **kwargs)
+
+    return _make
 
 
 @pytest.mark.parametrize(
-    ["app_name", "app_author"], (("MyApp", "cnheider"), ("YourApp", "you")), ids=["my", "you"],
+    ["app_name", "app_author", "app_version"],
+    (
+        ("MyApp", "cnheider", "1.0"),
+        ("YourApp", "you", "1.0"),
+        ("MyApp", "cnheider", None),
+        ("YourApp", "you", None),
+        ("MyApp", None, None),
+        ("YourApp", None, None),
+    ),
+    ids=["my", "you", "my_no_ver", "you_no_ver", "my_no_author", "you_no_author"],
 )
-def test_no_ver(app_name, app_author):
-    print("\n-- app dirs (without optional 'version')")
-    dirs = app_path.AppPath(app_name, app_author, ensure_existence_on_access=False)
-    for prop in props:
-        print(f"{prop}: {getattr(dirs, prop)}")
-    dirs.clean()
-
-
-@pytest.mark.parametrize(["app_name"], (("MyApp",), ("YourApp",)), ids=["my", "you"])
-def test_author(app_name):
-    print("\n-- app dirs (without optional '_app_author')")
-    dirs = app_path.AppPath(app_name, ensure_existence_on_access=False)
-    for prop in props:
-        print(f"{prop}: {getattr(dirs, prop)}")
-    dirs.clean()
-
-
-@pytest.mark.parametrize(["app_name"], (("MyApp",), ("YourApp",)), ids=["my", "you"])
-def test_no_author(app_name):
-    print("\n-- app dirs (with disabled '_app_author')")
-    dirs = app_path.AppPath(app_name, ensure_existence_on_access=False)
-    for prop in props:
-        print(f"{prop}: {getattr(dirs, prop)}")
-    dirs.clean()
+def test_app_dirs(app_name, app_author, app_version, make_dirs):
+    """One test over the optional-argument axes, None meaning the argument is not passed"""
+    kwargs = {
+        key: value
+        for key, value in (("app_author", app_author), ("app_version", app_version))
+        if value is not None
+    }
+    dirs = make_dirs(app_name, **kwargs)
+    _dump_props(dirs)
 
 
 """
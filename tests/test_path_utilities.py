@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import time
+
+import pytest
+
+__author__ = "Christian Heider Nielsen"
+__doc__ = ""
+
+from apppath import AppPath, reset_env_cache
+from apppath.utilities import background_rmtree, fast_rmtree
+
+_XDG_VARS = (
+    "XDG_DATA_HOME",
+    "XDG_CONFIG_HOME",
+    "XDG_CACHE_HOME",
+    "XDG_STATE_HOME",
+    "XDG_DATA_DIRS",
+    "XDG_CONFIG_DIRS",
+)
+
+
+def _make_tree(base):
+    """A small nested tree with files at several depths"""
+    (base / "a" / "b").mkdir(parents=True)
+    (base / "a" / "b" / "deep.txt").write_text("deep")
+    (base / "a" / "shallow.txt").write_text("shallow")
+    return base
+
+
+def test_fast_rmtree_removes_nested_tree(tmp_path):
+    tree = _make_tree(tmp_path / "tree")
+    fast_rmtree(tree)
+    assert not tree.exists()
+
+
+def test_fast_rmtree_does_not_follow_symlinks(tmp_path):
+    target = tmp_path / "target"
+    target.mkdir()
+    (target / "keep.txt").write_text("keep")
+    tree = tmp_path / "tree"
+    tree.mkdir()
+    (tree / "link").symlink_to(target)
+    fast_rmtree(tree)
+    assert not tree.exists()
+    assert (target / "keep.txt").exists()  # only the link itself may be removed
+
+
+def test_fast_rmtree_missing_is_noop(tmp_path):
+    fast_rmtree(tmp_path / "absent")
+    assert not any(tmp_path.iterdir())
+
+
+def test_background_rmtree_reclaims_name_and_removes(tmp_path):
+    tree = _make_tree(tmp_path / "tree")
+    background_rmtree(tree)
+    assert not tree.exists()  # the rename reclaims the original name immediately
+    for _ in range(100):  # the bulk delete runs on a daemon thread
+        if not any(tmp_path.iterdir()):
+            break
+        time.sleep(0.05)
+    assert not any(tmp_path.iterdir())
+
+
+def test_background_rmtree_missing_is_noop(tmp_path):
+    background_rmtree(tmp_path / "absent")
+    assert not any(tmp_path.iterdir())
+
+
+@pytest.fixture
+def xdg_dirs(tmp_path, monkeypatch):
+    """Point every XDG base dir, including the site DATA_DIRS/CONFIG_DIRS, at tmp_path and reset the
+    env memos around the test, so nothing touches /usr/local/share or /etc/xdg"""
+    for var in _XDG_VARS:
+        monkeypatch.setenv(var, str(tmp_path / var.lower()))
+    reset_env_cache()
+    yield tmp_path
+    reset_env_cache()
+
+
+@pytest.mark.parametrize("parallel", (True, False), ids=["parallel", "serial"])
+def test_clean_removes_trees(xdg_dirs, parallel):
+    dirs = AppPath("cleandemo")
+    dirs.ensure_all()
+    assert (xdg_dirs / "xdg_cache_home" / "cleandemo").is_dir()
+    dirs.clean(parallel=parallel)
+    for var in ("xdg_data_home", "xdg_config_home", "xdg_cache_home", "xdg_data_dirs", "xdg_config_dirs"):
+        assert not (xdg_dirs / var / "cleandemo").exists()
+
+
+def test_clean_invalidates_cache_and_recreates_on_access(xdg_dirs):
+    dirs = AppPath("cleandemo")
+    cache = dirs.user_cache
+    cache.mkdir(parents=True, exist_ok=True)
+    dirs.clean()
+    assert "user_cache" not in dirs._path_cache
+    assert dirs.user_cache.is_dir()  # next access recomputes and re-ensures